@@ -3,7 +3,7 @@
 # Licensed under the MIT License.
 # ------------------------------------
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from azure.core.rest import HttpResponse
 
@@ -19,6 +19,15 @@ from ._generated.models import (
     Setting,
 )
 
+# enum member lookups go through the metaclass, so the hot paths below compare against a module-level reference
+_BOOLEAN = KeyVaultSettingType.BOOLEAN
+# serialized forms of boolean setting values, so common inputs don't need to be lower-cased
+_BOOLEAN_STRINGS = {"true": "true", "false": "false", "True": "true", "False": "false"}
+# serialized boolean setting values and the bools they represent
+_BOOLEAN_PARSE = {"true": True, "false": False}
+# service setting types that map to a KeyVaultSettingType member; other types are passed through as-is
+_SETTING_TYPES = {"boolean": _BOOLEAN}
+
 
 class KeyVaultPermission(object):
     """Role definition permissions.
@@ -31,11 +40,21 @@ class KeyVaultPermission(object):
      other role definitions assigned to a principal.
     """
 
-    def __init__(self, **kwargs: Any) -> None:
-        self.actions = kwargs.get("actions")
-        self.not_actions = kwargs.get("not_actions")
-        self.data_actions = kwargs.get("data_actions")
-        self.not_data_actions = kwargs.get("not_data_actions")
+    __slots__ = ("actions", "not_actions", "data_actions", "not_data_actions")
+
+    def __init__(  # pylint:disable=unused-argument
+        self,
+        *,
+        actions: Optional[List[str]] = None,
+        not_actions: Optional[List[str]] = None,
+        data_actions: Optional[List[str]] = None,
+        not_data_actions: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.actions = actions
+        self.not_actions = not_actions
+        self.data_actions = data_actions
+        self.not_data_actions = not_data_actions
 
     @classmethod
     def _from_generated(cls, permissions: Permission) -> "KeyVaultPermission":
@@ -56,11 +75,21 @@ class KeyVaultRoleAssignment(object):
     :ivar str type: type of the assignment
     """
 
-    def __init__(self, **kwargs: Any) -> None:
-        self.name = kwargs.get("name")
-        self.properties = kwargs.get("properties")
-        self.role_assignment_id = kwargs.get("role_assignment_id")
-        self.type = kwargs.get("assignment_type")
+    __slots__ = ("name", "properties", "role_assignment_id", "type")
+
+    def __init__(  # pylint:disable=unused-argument
+        self,
+        *,
+        name: Optional[str] = None,
+        properties: Optional["KeyVaultRoleAssignmentProperties"] = None,
+        role_assignment_id: Optional[str] = None,
+        assignment_type: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.name = name
+        self.properties = properties
+        self.role_assignment_id = role_assignment_id
+        self.type = assignment_type
 
     def __repr__(self) -> str:
         return f"KeyVaultRoleAssignment<{self.role_assignment_id}>"
@@ -68,12 +97,13 @@ class KeyVaultRoleAssignment(object):
     @classmethod
     def _from_generated(cls, role_assignment: RoleAssignment) -> "KeyVaultRoleAssignment":
         # pylint:disable=protected-access
+        properties = role_assignment.properties
         return cls(
             role_assignment_id=role_assignment.id,
             name=role_assignment.name,
             assignment_type=role_assignment.type,
-            properties=KeyVaultRoleAssignmentProperties._from_generated(role_assignment.properties)
-            if role_assignment.properties
+            properties=KeyVaultRoleAssignmentProperties._from_generated(properties)
+            if properties
             else KeyVaultRoleAssignmentProperties(),
         )
 
@@ -87,15 +117,24 @@ class KeyVaultRoleAssignmentProperties(object):
     :ivar str scope: the scope of the assignment
     """
 
-    def __init__(self, **kwargs: Any) -> None:
-        self.principal_id = kwargs.get("principal_id")
-        self.role_definition_id = kwargs.get("role_definition_id")
-        self.scope = kwargs.get("scope")
+    __slots__ = ("principal_id", "role_definition_id", "scope")
+
+    def __init__(  # pylint:disable=unused-argument
+        self,
+        *,
+        principal_id: Optional[str] = None,
+        role_definition_id: Optional[str] = None,
+        scope: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.principal_id = principal_id
+        self.role_definition_id = role_definition_id
+        self.scope = scope
 
     def __repr__(self) -> str:
         string = (
             f"KeyVaultRoleAssignmentProperties(principal_id={self.principal_id}, "
-            + f"role_definition_id={self.role_definition_id}, scope={self.scope})"
+            f"role_definition_id={self.role_definition_id}, scope={self.scope})"
         )
         return string[:1024]
 
@@ -105,10 +144,14 @@ class KeyVaultRoleAssignmentProperties(object):
     ) -> "KeyVaultRoleAssignmentProperties":
         # the generated RoleAssignmentProperties and RoleAssignmentPropertiesWithScope
         # models differ only in that the latter has a "scope" attribute
+        if isinstance(role_assignment_properties, RoleAssignmentPropertiesWithScope):
+            scope = role_assignment_properties.scope
+        else:
+            scope = None
         return cls(
             principal_id=role_assignment_properties.principal_id,
             role_definition_id=role_assignment_properties.role_definition_id,
-            scope=getattr(role_assignment_properties, "scope", None),
+            scope=scope,
         )
 
 
@@ -125,15 +168,38 @@ class KeyVaultRoleDefinition(object):
     :ivar str type: type of the role definition
     """
 
-    def __init__(self, **kwargs: Any) -> None:
-        self.assignable_scopes = kwargs.get("assignable_scopes")
-        self.description = kwargs.get("description")
-        self.id = kwargs.get("id")
-        self.name = kwargs.get("name")
-        self.permissions = kwargs.get("permissions")
-        self.role_name = kwargs.get("role_name")
-        self.role_type = kwargs.get("role_type")
-        self.type = kwargs.get("type")
+    __slots__ = (
+        "assignable_scopes",
+        "description",
+        "id",
+        "name",
+        "permissions",
+        "role_name",
+        "role_type",
+        "type",
+    )
+
+    def __init__(  # pylint:disable=unused-argument
+        self,
+        *,
+        assignable_scopes: Optional[List[str]] = None,
+        description: Optional[str] = None,
+        id: Optional[str] = None,  # pylint:disable=redefined-builtin
+        name: Optional[str] = None,
+        permissions: Optional[List[KeyVaultPermission]] = None,
+        role_name: Optional[str] = None,
+        role_type: Optional[str] = None,
+        type: Optional[str] = None,  # pylint:disable=redefined-builtin
+        **kwargs: Any,
+    ) -> None:
+        self.assignable_scopes = assignable_scopes
+        self.description = description
+        self.id = id
+        self.name = name
+        self.permissions = permissions
+        self.role_name = role_name
+        self.role_type = role_type
+        self.type = type
 
     def __repr__(self) -> str:
         return f"KeyVaultRoleDefinition<{self.id}>"
@@ -141,16 +207,19 @@ class KeyVaultRoleDefinition(object):
     @classmethod
     def _from_generated(cls, definition: RoleDefinition) -> "KeyVaultRoleDefinition":
         # pylint:disable=protected-access
+        properties = definition.properties
+        if not properties:
+            return cls(id=definition.id, name=definition.name, type=definition.type)
+
+        permission_from_generated = KeyVaultPermission._from_generated
         return cls(
-            assignable_scopes=definition.properties.assignable_scopes if definition.properties else None,
-            description=definition.properties.description if definition.properties else None,
+            assignable_scopes=properties.assignable_scopes,
+            description=properties.description,
             id=definition.id,
             name=definition.name,
-            permissions=[KeyVaultPermission._from_generated(p) for p in definition.properties.permissions or []]
-            if definition.properties
-            else None,
-            role_name=definition.properties.role_name if definition.properties else None,
-            role_type=definition.properties.role_type if definition.properties else None,
+            permissions=[permission_from_generated(p) for p in properties.permissions or ()],
+            role_name=properties.role_name,
+            role_type=properties.role_type,
             type=definition.type,
         )
 
@@ -169,25 +238,36 @@ class KeyVaultBackupOperation:
     :ivar str folder_url: The URL of the Azure Blob Storage container where the backup is stored.
     """
 
-    # pylint:disable=unused-argument
+    __slots__ = ("status", "status_details", "error", "start_time", "end_time", "job_id", "folder_url")
 
-    def __init__(self, **kwargs: Any) -> None:
-        self.status: Optional[str] = kwargs.get("status")
-        self.status_details: Optional[str] = kwargs.get("status_details")
-        self.error: Optional[str] = kwargs.get("error")
-        self.start_time: Optional[datetime] = kwargs.get("start_time")
-        self.end_time: Optional[datetime] = kwargs.get("end_time")
-        self.job_id: Optional[str] = kwargs.get("job_id")
-        self.folder_url: Optional[str] = kwargs.get("folder_url")
+    def __init__(  # pylint:disable=unused-argument
+        self,
+        *,
+        status: Optional[str] = None,
+        status_details: Optional[str] = None,
+        error: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        job_id: Optional[str] = None,
+        folder_url: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.status = status
+        self.status_details = status_details
+        self.error = error
+        self.start_time = start_time
+        self.end_time = end_time
+        self.job_id = job_id
+        self.folder_url = folder_url
 
     @classmethod
     def _from_generated(
-        cls, response: HttpResponse, deserialized_operation: FullBackupOperation, response_headers: Dict
+        cls, _response: HttpResponse, deserialized_operation: FullBackupOperation, _response_headers: Dict
     ) -> "KeyVaultBackupOperation":
         error = deserialized_operation.error
         error_message: Optional[str] = None
-        if error and error.message:
-            error_message = f"{error.code}: {error.message}"
+        if error and (message := error.message):
+            error_message = f"{error.code}: {message}"
         return cls(
             status=deserialized_operation.status,
             status_details=deserialized_operation.status_details,
@@ -205,16 +285,19 @@ class KeyVaultBackupResult(object):
     :ivar str folder_url: URL of the Azure Blob Storage container containing the backup
     """
 
-    # pylint:disable=unused-argument
+    __slots__ = ("folder_url",)
 
-    def __init__(self, **kwargs: Any) -> None:
-        self.folder_url: Optional[str] = kwargs.get("folder_url")
+    def __init__(self, *, folder_url: Optional[str] = None, **kwargs: Any) -> None:  # pylint:disable=unused-argument
+        self.folder_url = folder_url
 
     @classmethod
     def _from_generated(
-        cls, response: HttpResponse, deserialized_operation: FullBackupOperation, response_headers: Dict
+        cls, _response: HttpResponse, deserialized_operation: FullBackupOperation, _response_headers: Dict
     ) -> "KeyVaultBackupResult":
-        return cls(folder_url=deserialized_operation.azure_storage_blob_container_uri)
+        # there's only one field to set, so there's no need to go through __init__
+        result = cls.__new__(cls)
+        result.folder_url = deserialized_operation.azure_storage_blob_container_uri
+        return result
 
 
 class KeyVaultRestoreOperation:
@@ -230,24 +313,34 @@ class KeyVaultRestoreOperation:
     :ivar str job_id: The job identifier of the restore operation.
     """
 
-    # pylint:disable=unused-argument
+    __slots__ = ("status", "status_details", "error", "start_time", "end_time", "job_id")
 
-    def __init__(self, **kwargs: Any) -> None:
-        self.status: Optional[str] = kwargs.get("status")
-        self.status_details: Optional[str] = kwargs.get("status_details")
-        self.error: Optional[str] = kwargs.get("error")
-        self.start_time: Optional[datetime] = kwargs.get("start_time")
-        self.end_time: Optional[datetime] = kwargs.get("end_time")
-        self.job_id: Optional[str] = kwargs.get("job_id")
+    def __init__(  # pylint:disable=unused-argument
+        self,
+        *,
+        status: Optional[str] = None,
+        status_details: Optional[str] = None,
+        error: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        job_id: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.status = status
+        self.status_details = status_details
+        self.error = error
+        self.start_time = start_time
+        self.end_time = end_time
+        self.job_id = job_id
 
     @classmethod
     def _from_generated(
-        cls, response: HttpResponse, deserialized_operation: RestoreOperation, response_headers: Dict
+        cls, _response: HttpResponse, deserialized_operation: RestoreOperation, _response_headers: Dict
     ) -> "KeyVaultRestoreOperation":
         error = deserialized_operation.error
         error_message: Optional[str] = None
-        if error and error.message:
-            error_message = f"{error.code}: {error.message}"
+        if error and (message := error.message):
+            error_message = f"{error.code}: {message}"
         return cls(
             status=deserialized_operation.status,
             status_details=deserialized_operation.status_details,
@@ -272,6 +365,8 @@ class KeyVaultSetting(object):
     :type setting_type: str or KeyVaultSettingType or None
     """
 
+    __slots__ = ("name", "value", "setting_type")
+
     def __init__(
         self,
         name: str,
@@ -281,19 +376,19 @@ class KeyVaultSetting(object):
     ) -> None:
         self.name = name
         self.value = value if isinstance(value, str) else str(value)  # `value` is stored as a string
-        if setting_type == KeyVaultSettingType.BOOLEAN:
-            self.setting_type: Optional[Union[str, KeyVaultSettingType]] = KeyVaultSettingType.BOOLEAN
-        else:
-            self.setting_type = setting_type.lower() if isinstance(setting_type, str) else setting_type
-
-        # If a setting type isn't provided, set it based on `value`'s type (without inferring from the value itself)
-        if self.setting_type is None:
+        if setting_type is None:
+            # If a setting type isn't provided, set it based on `value`'s type (without inferring from the value itself)
             if isinstance(value, bool):
-                self.setting_type = KeyVaultSettingType.BOOLEAN
+                setting_type = _BOOLEAN
+        elif setting_type == _BOOLEAN:
+            setting_type = _BOOLEAN
+        elif isinstance(setting_type, str):
+            setting_type = setting_type.lower()
+        self.setting_type: Optional[Union[str, KeyVaultSettingType]] = setting_type
 
         # If the setting is a boolean, lower-case the string for serialization
-        if self.setting_type == KeyVaultSettingType.BOOLEAN:
-            self.value = self.value.lower()
+        if setting_type == _BOOLEAN:
+            self.value = _BOOLEAN_STRINGS.get(self.value) or self.value.lower()
 
     def getboolean(self) -> bool:
         """Gets the account setting value as a boolean if the ``setting_type`` is ``KeyVaultSettingType.BOOLEAN``.
@@ -303,11 +398,10 @@ class KeyVaultSetting(object):
 
         :raises ValueError: if the ``setting_type`` is not boolean or the value cannot be represented as a boolean.
         """
-        if self.setting_type == KeyVaultSettingType.BOOLEAN:
-            if self.value == "true":
-                return True
-            if self.value == "false":
-                return False
+        if self.setting_type == _BOOLEAN:
+            result = _BOOLEAN_PARSE.get(self.value)
+            if result is not None:
+                return result
         raise ValueError(
             'The `setting_type` of the setting must be `KeyVaultSettingType.BOOLEAN` and the `value` must be "true" '
             'or "false" in order to use `getboolean`.'
@@ -315,5 +409,7 @@ class KeyVaultSetting(object):
 
     @classmethod
     def _from_generated(cls, setting: Setting) -> "KeyVaultSetting":
-        setting_type = KeyVaultSettingType.BOOLEAN if setting.type == "boolean" else setting.type
-        return cls(name=setting.name, value=setting.value, setting_type=setting_type)
+        setting_type = setting.type
+        return cls(
+            name=setting.name, value=setting.value, setting_type=_SETTING_TYPES.get(setting_type, setting_type)
+        )
@@ -9,7 +9,7 @@
 import re
 import os.path
 from io import open
-from setuptools import find_packages, setup
+from setuptools import Extension, find_packages, setup
 
 # Change the PACKAGE_NAME only to change folder and different name
 PACKAGE_NAME = "azure-keyvault-administration"
@@ -27,6 +27,22 @@ with open(os.path.join(PACKAGE_FOLDER_PATH, "_version.py"), "r") as fd:
 if not VERSION:
     raise RuntimeError("Cannot find version information")
 
+# Opt-in compilation of the model layer with Cython (requires Cython at build time). The pure-Python modules are always
+# packaged, so the compiled extension is only an accelerator and builds without this flag are unaffected.
+EXT_MODULES = []
+if os.environ.get("AZURE_KEYVAULT_ADMINISTRATION_CYTHONIZE", "").lower() in ("1", "true"):
+    from Cython.Build import cythonize  # pylint:disable=import-error
+
+    # `azure` and `azure.keyvault` are namespace packages, so the module name must be given explicitly; Cython would
+    # otherwise derive it from the nearest __init__.py and build a top-level `administration` package.
+    # Annotations are type hints only: Cython would otherwise enforce them as exact types, rejecting `None` for `str`
+    # parameters and the str-based enum values the generated models return.
+    EXT_MODULES = cythonize(
+        [Extension(f"{NAMESPACE_NAME}._models", [os.path.join(PACKAGE_FOLDER_PATH, "_models.py")])],
+        language_level=3,
+        compiler_directives={"annotation_typing": False},
+    )
+
 with open("README.md", encoding="utf-8") as f:
     README = f.read()
 with open("CHANGELOG.md", encoding="utf-8") as f:
@@ -66,6 +82,7 @@ setup(
             "azure.keyvault",
         ]
     ),
+    ext_modules=EXT_MODULES,
     python_requires=">=3.8",
     install_requires=[
         "azure-core>=1.31.0",
@@ -0,0 +1,93 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import importlib.machinery
+import importlib.util
+import os
+
+import pytest
+from azure.keyvault.administration import _models
+from azure.keyvault.administration._generated.models import (
+    FullBackupOperation,
+    RestoreOperation,
+    RoleAssignment,
+    RoleDefinition,
+    Setting,
+)
+
+CYTHONIZE = os.environ.get("AZURE_KEYVAULT_ADMINISTRATION_CYTHONIZE", "").lower() in ("1", "true")
+
+# raw service payloads; the generated models deserialize their enum-typed fields to enum members
+ROLE_ASSIGNMENT = {
+    "id": "/providers/Microsoft.Authorization/roleAssignments/assignment",
+    "name": "assignment",
+    "type": "Microsoft.Authorization/roleAssignments",
+    "properties": {"scope": "/keys", "roleDefinitionId": "definition", "principalId": "principal"},
+}
+ROLE_DEFINITION = {
+    "id": "/providers/Microsoft.Authorization/roleDefinitions/definition",
+    "name": "definition",
+    "type": "Microsoft.Authorization/roleDefinitions",
+    "properties": {
+        "roleName": "role",
+        "description": "description",
+        "type": "CustomRole",
+        "permissions": [{"dataActions": ["Microsoft.KeyVault/managedHsm/keys/read/action"], "notDataActions": []}],
+        "assignableScopes": ["/"],
+    },
+}
+OPERATION = {
+    "status": "Failed",
+    "statusDetails": "details",
+    "error": {"code": "code", "message": "message"},
+    "startTime": 1700000000,
+    "endTime": 1700000060,
+    "jobId": "job",
+}
+BACKUP_OPERATION = dict(OPERATION, azureStorageBlobContainerUri="https://account.blob.core.windows.net/backup/folder")
+SETTING = {"name": "AllowKeyManagementOperationsThroughARM", "value": "True", "type": "boolean"}
+
+
+def _load_pure_python_models():
+    path = os.path.join(os.path.dirname(_models.__file__), "_models.py")
+    spec = importlib.util.spec_from_file_location("azure.keyvault.administration._pure_python_models", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _fields(value):
+    """Recursively converts a model to plain data so models from different modules can be compared"""
+    if isinstance(value, list):
+        return [_fields(item) for item in value]
+    if hasattr(value, "__slots__"):
+        return (type(value).__name__, {name: _fields(getattr(value, name)) for name in value.__slots__})
+    return value
+
+
+def _convert(models):
+    return [
+        models.KeyVaultRoleAssignment._from_generated(RoleAssignment(ROLE_ASSIGNMENT)),
+        models.KeyVaultRoleDefinition._from_generated(RoleDefinition(ROLE_DEFINITION)),
+        models.KeyVaultBackupOperation._from_generated(None, FullBackupOperation(BACKUP_OPERATION), {}),
+        models.KeyVaultBackupResult._from_generated(None, FullBackupOperation(BACKUP_OPERATION), {}),
+        models.KeyVaultRestoreOperation._from_generated(None, RestoreOperation(OPERATION), {}),
+        models.KeyVaultSetting._from_generated(Setting(SETTING)),
+    ]
+
+
+@pytest.mark.skipif(not CYTHONIZE, reason="package not built with AZURE_KEYVAULT_ADMINISTRATION_CYTHONIZE")
+def test_compiled_models():
+    # the extension built by setup.py must shadow the pure-Python module it was compiled from
+    assert isinstance(_models.__loader__, importlib.machinery.ExtensionFileLoader), _models.__file__
+
+    pure_python_models = _load_pure_python_models()
+    assert isinstance(pure_python_models.__loader__, importlib.machinery.SourceFileLoader)
+
+    assert _fields(_convert(_models)) == _fields(_convert(pure_python_models))
+
+    setting = _models.KeyVaultSetting(name="setting", value=True)
+    assert setting.setting_type == _models.KeyVaultSettingType.BOOLEAN
+    assert setting.value == "true"
+    assert setting.getboolean()